@@ -9,47 +9,216 @@ Run:
 
 Output:
 	leeghwaterplas_map.html
+	thumbnails/  (popup images, publish together with the HTML)
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import os
+import re
+import tempfile
 from pathlib import Path
-import folium
-from folium.plugins import MeasureControl, Draw, LocateControl
-import base64
-import shutil
-from PIL import Image
-from io import BytesIO
-
-
-def load_images_to_map(marker_images_paths):
-	"""Load images from paths and return a map of base64 encoded strings."""
-	image_map = {}
-	for name, paths in marker_images_paths.items():
-		img_srcs = []
-		for img_path in paths:
-			if img_path.exists():
-				try:
-					img = Image.open(img_path)
-					img.thumbnail((400, 400))  # Resize
-					buffer = BytesIO()
-					format_type = 'JPEG' if img_path.suffix.lower() in ['.jpg', '.jpeg'] else 'PNG'
-					img.save(buffer, format=format_type)
-					encoded = base64.b64encode(buffer.getvalue()).decode('utf-8')
-					img_srcs.append(f"data:image/{format_type.lower()};base64,{encoded}")
-				except Exception as e:
-					print(f"Failed to process {img_path}: {e}")
-					img_srcs.append("https://via.placeholder.com/180x120.jpg")
-			else:
-				img_srcs.append("https://via.placeholder.com/180x120.jpg")
-		image_map[name] = img_srcs
-	return image_map
+from statistics import fmean
+from typing import TYPE_CHECKING
+
+# folium (with Jinja2/branca) and PIL are imported where they are used, so that
+# importing this module for its constants stays cheap
+if TYPE_CHECKING:
+	from collections.abc import Mapping, Sequence
+	from jinja2 import Template
+
+
+# Points of interest and recreational facilities around Leeghwaterplas
+# Format: (location, name, color, description)
+POI_MARKERS = [
+	((52.383042, 5.226031), "Potentieel skatepark", "purple", "Dit is een prachtige locatie om een skatepark te bouwen, dicht bij de Leeghwaterplas en omgeven door groen. Het zou een geweldige toevoeging zijn voor de lokale gemeenschap en skaters van alle niveaus aantrekken. Hieronder de AI-impressie van een skate- en sportpark! Als het skatepark gerealiseerd wordt, zou er ook een 'Wall of Fame' kunnen komen om legaal grafitti te doen! Dit zou de hangplek mogelijk ook netter achterlaten."),
+	((52.385084372447785, 5.231053016061975), "Voetbalveldje 1", "green", "Een voetbalveldje waar niet veel liefde aan geschonken wordt. De hangplek ernaast maakt het juist aantrekkelijk om naartoe te gaan, omdat je spullen daar kwijt kan terwijl je een balletje trapt. Door dit veldje op te knappen en beter te onderhouden, kan het een leuke plek worden om samen te komen en te sporten."),
+	((52.384948830666964, 5.230788086557764), "Hangplek", "red", "Er wordt aangegeven dat de jongeren die hier komen, hun afval netjes in zakken doen die te groot zijn voor de prullenbak ernaast. Hierdoor pikken de vogels de zakken open en ontstaat er vooralsnog rotzooi die niet opgeruimd wordt. Het zou helpen als er meer en grotere prullenbakken geplaatst worden, zodat het afval direct in de bak kan worden gegooid en niet op de grond terechtkomt. Daarnaast zou een lakje verf op de bankjes en tafels de plek een stuk gezelliger maken."),
+	((52.38433374080158, 5.2265479223225775), "Voetbalveldje 2", "green", "Het voetbalveldje voor de jongere kinderen die nog niet zo ver kunnen trappen. Voor deze leeftijdsgroep is het leuk om dit voetbalveldje te behouden, maar dat vraagt wel naar meer onderhoud."),
+	((52.38359793506318, 5.226425716425748), "Voetbalveldje 3", "green", "Ons meest populaire veld! Bij een interview is naar voren gekomen dat dit vroeger een basketbalveld en voetbalveld in één was! (Het staat op google maps bijv. ook als basketbalveld aangeduid). Als wij de basketbalringen weer terugkunnen krijgen op dit veld, zou het de jongeren een stuk meer aantrekken!"),
+	((52.383354830748196, 5.226486407880928), "Mini ramp Waterwijk", "green", "Deze kleine ramp kan in onze ogen weg, als het skatepark gerealiseerd wordt. Wat er dan voor in de plaats komt? Misschien wat bankjes, de 'Wall of Fame' voor grafitti, of een plek om te rusten langs het water!"),
+	((52.38321450500632, 5.22893373521717), "Derde waterbrug", "beige", "Derde waterbrug is een grote brug die de eilanden van Leeghwaterplas met elkaar verbindt. Vanaf de brug heb je een prachtig uitzicht!"),
+	((52.38499231701249, 5.228897594059279), "Speeltuin Leeghwaterpad", "green", "Dit speeltuintje bestaat uit twee speel onderdelen, met veel sport apparatuur van de sport wandelroute die door Leeghwaterplas heen verspreid is."),
+	((52.384585484880404, 5.226733398543588), "Speeltuin Lekstraat", "green", "Dit speeltuintje bestaat uit twee speel onderdelen, met veel sport apparatuur van de sport wandelroute die door Leeghwaterplas heen verspreid is."),
+	((52.384828522088235, 5.241236654816445), "Jeugdland Almere-Stad", "green", "Jeugdland Almere-Stad is voor kinderen tussen de 2 en 14 jaar oud, dus helaas past onze doelgroep daar niet meer bij."),
+	((52.38081268315322, 5.234542754595652), "Hannie Schaftpark", "darkgreen", "Hannie Schaftpark heeft verschillende bosvakken, maar ook open gedeeltes met dieren van Stadsboerderij De Kemphaan!"),
+	((52.38422690678109, 5.239685202707825), "Bos der Onverzettelijken", "darkgreen", " 'Het geven van invulling aan de uitvoering van de verantwoordelijkheden van de gemeente Almere, voortvloeiend uit het convenant van 29 april 1993 en tevens de rol overneemt van de in het convenant genoemde 'begeleidingscomissie' van de Stichting Samenwerkend Verzet.' "),
+	((52.384226906789316, 5.225214172870135), "Buurtcentrum De Draaikolk", "beige", "Een plek om samen te komen, waar momenteel weinig tot geen activiteiten voor jongeren georganiseerd worden. Door bijvoorbeeld een moestuin aan te leggen naast het buurtcentrum (waar al ruimte voor vrijgemaakt is), meer activiteiten te organiseren door het jaar heen en de mogelijkheid aan te bieden om binnen te wandelen kan dit buurtcentrum een ontmoetingsplek worden voor jongeren! Zo blijven ze niet buiten de deur hangen."),
+	((52.38317, 5.23377), "Leeghwaterplas", "blue", "Onze gekozen locatie om aantrekkelijk te maken voor jongeren tussen de 17 en 24 jaar!"),
+	((52.38707028156098, 5.226383755138824), "Bushalte Waterwijk West", "beige", "Bushalte met een loopafstand van circa 5 minuten naar Leeghwaterplas!"),
+	((52.38335138687997, 5.225857775186909), "Bankjes", "purple", "Wat rustplekken verspreiden door Leeghwaterplas kan ervoor zorgen dat jongeren langer blijven rondhangen om te zitten en praten. Hierbij hebben wij ook gekeken naar het ontwerp van de bankjes. Om zowel onderdak te bieden als het zwervervriendelijker te maken, zijn de bankjes zoals hieronder een goede keuze. Verder zijn bankjes zoals in de AI simulatie ook een goed alternatief!" ),
+	((52.38521877325971, 5.23229183072874), "Steiger Leeghwaterplas", "beige", "Een bootje aanleggen of het water inspringen? Vanaf de grootste steiger in Leeghwaterplas kan het! Er zijn meerdere steigers op deze locatie, maar dit is wel de meest aantrekkelijke!"),
+]
+
+IMAGES_DIR = Path(__file__).parent / "Images_Leegh"
+
+# Marker images: name -> list of paths
+MARKER_IMAGE_PATHS = {
+	"Buurtcentrum De Draaikolk": [IMAGES_DIR / "buurtcenrtum_resized.jpg", IMAGES_DIR / "BC_binnen.jpg", IMAGES_DIR / "BC_bar.jpg"],
+	"Hannie Schaftpark": [IMAGES_DIR / "hannie-schaftpark.png"],
+	"Jeugdland Almere-Stad": [IMAGES_DIR / "Jeugdland.jpg"],
+	"Bos der Onverzettelijken": [IMAGES_DIR / "bos_onverzettelijk_resized.jpg"],
+	"Leeghwaterplas": [IMAGES_DIR / "IMG_6750.JPG",IMAGES_DIR / "Leeghwaterplas.jpg", IMAGES_DIR / "DSCF7055.JPG"],
+	"Steiger Leeghwaterplas": [IMAGES_DIR / "IMG_6776.JPG",IMAGES_DIR / "Steiger.jpg", IMAGES_DIR / "steiger_personen.jpg"],
+	"Speeltuin Leeghwaterpad": [IMAGES_DIR / "speeltuintje.jpg"],
+	"Speeltuin Lekstraat": [IMAGES_DIR / "bokspringen.jpg"],
+	"Bushalte Waterwijk West": [IMAGES_DIR / "Schermafbeelding 2026-02-01 232306.png"],
+	"Hangplek": [IMAGES_DIR / "hangplek.jpg"],
+	"Voetbalveldje 1": [IMAGES_DIR / "voetbalveldje1.jpg"],
+	"Voetbalveldje 2": [IMAGES_DIR / "Voetbalveldje2.jpg"],
+	"Voetbalveldje 3": [IMAGES_DIR / "Voetbalveldje3.jpg"],
+	"Mini ramp Waterwijk": [IMAGES_DIR / "mini_ramp.jpg"],
+	"Bankjes": [IMAGES_DIR / "bank.jpg"],
+	"Derde waterbrug": [IMAGES_DIR / "Derde_brug.jpg", IMAGES_DIR / "Schermafbeelding 2026-02-01 144515.png"],
+	"Potentieel skatepark": [IMAGES_DIR / "Before_skatepark.jpg", IMAGES_DIR / "skatepark_mini.jpg"],
+}
+
+
+# Thumbnails are written next to the generated HTML and referenced by relative URL
+THUMB_DIR_NAME = "thumbnails"
+# Bump when the thumbnail pipeline changes so stale thumbnails are not reused
+IMAGE_CACHE_VERSION = 5
+# Only files matching this pattern are ever pruned from the thumbnail folder
+_THUMB_NAME_RE = re.compile(r"[0-9a-f]{40}\.\w+(\.\w+\.tmp)?")
+PLACEHOLDER_SRC = "https://via.placeholder.com/180x120.jpg"
+POPUP_TMPL_SOURCE = (
+	'<div style="width:300px;max-height:{{ height }}px;overflow:auto">'
+	'<b>{{ name }}</b><br><small>{{ desc }}</small>'
+	'{% for s in srcs %}<br><img src="{{ s }}" width="280" alt="{{ name }} image" loading="lazy" decoding="async">{% endfor %}'
+	'</div>'
+)
+
+
+@lru_cache(maxsize=None)
+def _popup_template() -> Template:
+	"""Return the popup body template, compiled once on first use and rendered per POI."""
+	from jinja2 import Template
+
+	return Template(POPUP_TMPL_SOURCE)
+
+
+@lru_cache(maxsize=None)
+def _thumbnail_key(path_str: str, mtime: float, size: int) -> str:
+	"""Return the thumbnail file stem for an image: a hash of the pipeline version and file contents.
+
+	Hashing contents rather than the path keeps names identical across checkouts.
+	The (path, mtime, size) arguments only memoise the hash within one process.
+	"""
+	digest = hashlib.sha1(f"{IMAGE_CACHE_VERSION}|".encode("utf-8"))
+	with open(path_str, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def _write_thumbnail(img_path: Path, key: str, out_dir: str) -> str:
+	"""Write the popup thumbnail for one image into out_dir/thumbnails and return its URL relative to out_dir.
+
+	An existing thumbnail with the same key is reused as-is.
+	"""
+	from PIL import Image
+
+	with Image.open(img_path) as img:
+		# Images that already fit 400px are published as-is instead of being re-encoded
+		small = max(img.size) <= 400
+		out = Path(out_dir) / THUMB_DIR_NAME / f"{key}{img_path.suffix.lower() if small else '.webp'}"
+		if not out.exists():
+			out.parent.mkdir(parents=True, exist_ok=True)
+			# Unique temp file per call: identical files share a key and may be written concurrently
+			fd, tmp_name = tempfile.mkstemp(prefix=f"{out.name}.", suffix=".tmp", dir=out.parent)
+			try:
+				with os.fdopen(fd, "wb") as f:
+					if small:
+						f.write(img_path.read_bytes())
+					else:
+						if img.format == 'JPEG':
+							# Let libjpeg scale in the DCT domain so the full-size bitmap is never decoded
+							img.draft('RGB', (400, 400))
+							img.load()
+							img.thumbnail((400, 400), Image.Resampling.BILINEAR)
+						else:
+							# thumbnail() box-reduces by whole factors in C before resampling (reducing_gap)
+							img.thumbnail((400, 400))  # Resize
+						# WebP is several times smaller than JPEG/PNG at the same visual quality
+						img.convert('RGB').save(f, format='WEBP', quality=80, method=4)
+				os.chmod(tmp_name, 0o644)  # mkstemp creates 0600; thumbnails are published
+				# Atomic, so a concurrent writer of the same key simply leaves identical bytes in place
+				os.replace(tmp_name, out)
+			except Exception:
+				Path(tmp_name).unlink(missing_ok=True)
+				raise
+	return f"{THUMB_DIR_NAME}/{out.name}"
+
+
+def _process_one(img_path: Path, entry: os.DirEntry | None, out_dir: str) -> str:
+	"""Thumbnail a single image, falling back to the placeholder if it is missing or broken."""
+	if entry is None:
+		return PLACEHOLDER_SRC
+	try:
+		st = entry.stat()
+		key = _thumbnail_key(str(img_path), st.st_mtime, st.st_size)
+		return _write_thumbnail(img_path, key, out_dir)
+	except Exception as e:
+		print(f"Failed to process {img_path}: {e}")
+		return PLACEHOLDER_SRC
+
+
+def load_images_to_map(marker_images_paths: Mapping[str, Sequence[str | Path]], out_dir: str | Path):
+	"""Write thumbnails for a name -> paths mapping into out_dir/thumbnails and return a map of their URLs.
+
+	URLs are relative to out_dir, the folder holding the map HTML.
+	Thumbnails already on disk are reused, so repeated calls only hash unchanged files once
+	per process and never decode them again.
+	"""
+	jobs = [(name, idx, Path(path)) for name, paths in marker_images_paths.items() for idx, path in enumerate(paths)]
+
+	# One directory listing per folder instead of an exists()/stat() round-trip per file
+	present = {}
+	for folder in {img_path.parent for _, _, img_path in jobs}:
+		try:
+			with os.scandir(folder) as it:
+				present.update((Path(entry.path), entry) for entry in it)
+		except OSError:
+			pass
+
+	# PIL releases the GIL while decoding/encoding, so threads overlap the per-image work.
+	# Each distinct path is processed once, even if several markers list it.
+	with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+		futures = {}
+		for _, _, img_path in jobs:
+			if img_path not in futures:
+				futures[img_path] = pool.submit(_process_one, img_path, present.get(img_path), str(out_dir))
+
+	image_map = {name: [None] * len(paths) for name, paths in marker_images_paths.items()}
+	for name, idx, img_path in jobs:
+		image_map[name][idx] = futures[img_path].result()
+	return {name: tuple(img_srcs) for name, img_srcs in image_map.items()}
+
+
+def _prune_thumbnails(out_dir: str | Path, image_map: dict[str, tuple[str, ...]]) -> None:
+	"""Delete thumbnails (and leftover .tmp files) in out_dir/thumbnails that the map no longer references."""
+	keep = {src.rpartition("/")[2] for srcs in image_map.values() for src in srcs}
+	try:
+		entries = list(os.scandir(Path(out_dir) / THUMB_DIR_NAME))
+	except OSError:
+		return
+	for entry in entries:
+		if entry.name not in keep and _THUMB_NAME_RE.fullmatch(entry.name):
+			os.remove(entry.path)
 
 
 def build_map(output: str | Path = "leeghwaterplas_map.html") -> Path:
+	import folium
+	from folium.plugins import MeasureControl, Draw, LocateControl, MarkerCluster
+
 	# Center coordinates for Leeghwaterplas, Almere (approximate)
 	center = (52.38317, 5.23377)
 
-	m = folium.Map(location=center, zoom_start=15, control_scale=True)
+	# Open the map on the middle of all points of interest
+	poi_center = (fmean(lat for (lat, _), *_ in POI_MARKERS), fmean(lon for (_, lon), *_ in POI_MARKERS))
+	m = folium.Map(location=poi_center, zoom_start=15, control_scale=True)
 
 	# Base layers
 	folium.TileLayer(
@@ -88,67 +257,40 @@ def build_map(output: str | Path = "leeghwaterplas_map.html") -> Path:
 		icon=folium.Icon(color="blue", icon="info-sign"),
 	).add_to(m)
 
-	# Points of interest and recreational facilities around Leeghwaterplas
-	# Format: (location, name, color)
-	poi_markers = [
-		((52.383042, 5.226031), "Potentieel skatepark", "purple", "Dit is een prachtige locatie om een skatepark te bouwen, dicht bij de Leeghwaterplas en omgeven door groen. Het zou een geweldige toevoeging zijn voor de lokale gemeenschap en skaters van alle niveaus aantrekken. Hieronder de AI-impressie van een skate- en sportpark! Als het skatepark gerealiseerd wordt, zou er ook een 'Wall of Fame' kunnen komen om legaal grafitti te doen! Dit zou de hangplek mogelijk ook netter achterlaten."),
-		((52.385084372447785, 5.231053016061975), "Voetbalveldje 1", "green", "Een voetbalveldje waar niet veel liefde aan geschonken wordt. De hangplek ernaast maakt het juist aantrekkelijk om naartoe te gaan, omdat je spullen daar kwijt kan terwijl je een balletje trapt. Door dit veldje op te knappen en beter te onderhouden, kan het een leuke plek worden om samen te komen en te sporten."),
-		((52.384948830666964, 5.230788086557764), "Hangplek", "red", "Er wordt aangegeven dat de jongeren die hier komen, hun afval netjes in zakken doen die te groot zijn voor de prullenbak ernaast. Hierdoor pikken de vogels de zakken open en ontstaat er vooralsnog rotzooi die niet opgeruimd wordt. Het zou helpen als er meer en grotere prullenbakken geplaatst worden, zodat het afval direct in de bak kan worden gegooid en niet op de grond terechtkomt. Daarnaast zou een lakje verf op de bankjes en tafels de plek een stuk gezelliger maken."),
-		((52.38433374080158, 5.2265479223225775), "Voetbalveldje 2", "green", "Het voetbalveldje voor de jongere kinderen die nog niet zo ver kunnen trappen. Voor deze leeftijdsgroep is het leuk om dit voetbalveldje te behouden, maar dat vraagt wel naar meer onderhoud."),
-		((52.38359793506318, 5.226425716425748), "Voetbalveldje 3", "green", "Ons meest populaire veld! Bij een interview is naar voren gekomen dat dit vroeger een basketbalveld en voetbalveld in één was! (Het staat op google maps bijv. ook als basketbalveld aangeduid). Als wij de basketbalringen weer terugkunnen krijgen op dit veld, zou het de jongeren een stuk meer aantrekken!"),
-		((52.383354830748196, 5.226486407880928), "Mini ramp Waterwijk", "green", "Deze kleine ramp kan in onze ogen weg, als het skatepark gerealiseerd wordt. Wat er dan voor in de plaats komt? Misschien wat bankjes, de 'Wall of Fame' voor grafitti, of een plek om te rusten langs het water!"),
-		((52.38321450500632, 5.22893373521717), "Derde waterbrug", "beige", "Derde waterbrug is een grote brug die de eilanden van Leeghwaterplas met elkaar verbindt. Vanaf de brug heb je een prachtig uitzicht!"),
-		((52.38499231701249, 5.228897594059279), "Speeltuin Leeghwaterpad", "green", "Dit speeltuintje bestaat uit twee speel onderdelen, met veel sport apparatuur van de sport wandelroute die door Leeghwaterplas heen verspreid is."),
-		((52.384585484880404, 5.226733398543588), "Speeltuin Lekstraat", "green", "Dit speeltuintje bestaat uit twee speel onderdelen, met veel sport apparatuur van de sport wandelroute die door Leeghwaterplas heen verspreid is."),
-		((52.384828522088235, 5.241236654816445), "Jeugdland Almere-Stad", "green", "Jeugdland Almere-Stad is voor kinderen tussen de 2 en 14 jaar oud, dus helaas past onze doelgroep daar niet meer bij."),
-		((52.38081268315322, 5.234542754595652), "Hannie Schaftpark", "darkgreen", "Hannie Schaftpark heeft verschillende bosvakken, maar ook open gedeeltes met dieren van Stadsboerderij De Kemphaan!"),
-		((52.38422690678109, 5.239685202707825), "Bos der Onverzettelijken", "darkgreen", " 'Het geven van invulling aan de uitvoering van de verantwoordelijkheden van de gemeente Almere, voortvloeiend uit het convenant van 29 april 1993 en tevens de rol overneemt van de in het convenant genoemde 'begeleidingscomissie' van de Stichting Samenwerkend Verzet.' "),
-		((52.384226906789316, 5.225214172870135), "Buurtcentrum De Draaikolk", "beige", "Een plek om samen te komen, waar momenteel weinig tot geen activiteiten voor jongeren georganiseerd worden. Door bijvoorbeeld een moestuin aan te leggen naast het buurtcentrum (waar al ruimte voor vrijgemaakt is), meer activiteiten te organiseren door het jaar heen en de mogelijkheid aan te bieden om binnen te wandelen kan dit buurtcentrum een ontmoetingsplek worden voor jongeren! Zo blijven ze niet buiten de deur hangen."),
-		((52.38317, 5.23377), "Leeghwaterplas", "blue", "Onze gekozen locatie om aantrekkelijk te maken voor jongeren tussen de 17 en 24 jaar!"),
-		((52.38707028156098, 5.226383755138824), "Bushalte Waterwijk West", "beige", "Bushalte met een loopafstand van circa 5 minuten naar Leeghwaterplas!"),
-		((52.38335138687997, 5.225857775186909), "Bankjes", "purple", "Wat rustplekken verspreiden door Leeghwaterplas kan ervoor zorgen dat jongeren langer blijven rondhangen om te zitten en praten. Hierbij hebben wij ook gekeken naar het ontwerp van de bankjes. Om zowel onderdak te bieden als het zwervervriendelijker te maken, zijn de bankjes zoals hieronder een goede keuze. Verder zijn bankjes zoals in de AI simulatie ook een goed alternatief!" ),
-		((52.38521877325971, 5.23229183072874), "Steiger Leeghwaterplas", "beige", "Een bootje aanleggen of het water inspringen? Vanaf de grootste steiger in Leeghwaterplas kan het! Er zijn meerdere steigers op deze locatie, maar dit is wel de meest aantrekkelijke!"),
-	]
-
-	# Marker images: name -> list of paths
-	marker_image_paths = {
-		"Buurtcentrum De Draaikolk": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\buurtcenrtum_resized.jpg"), Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\BC_binnen.jpg"), Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\BC_bar.jpg")],
-		"Hannie Schaftpark": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\hannie-schaftpark.png")],
-		"Jeugdland Almere-Stad": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Jeugdland.jpg")],
-		"Bos der Onverzettelijken": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\bos_onverzettelijk_resized.jpg")],
-		"Leeghwaterplas": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\IMG_6750.JPG"),Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Leeghwaterplas.jpg"), Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\DSCF7055.JPG")],
-		"Steiger Leeghwaterplas": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\IMG_6776.JPG"),Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Steiger.jpg"), Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\steiger_personen.jpg")],
-		"Speeltuin Leeghwaterpad": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\speeltuintje.jpg")],
-		"Speeltuin Lekstraat": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\bokspringen.jpg")],
-		"Bushalte Waterwijk West": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Schermafbeelding 2026-02-01 232306.png")],
-		"Hangplek": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\hangplek.jpg")],
-		"Voetbalveldje 1": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\voetbalveldje1.jpg")],
-		"Voetbalveldje 2": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Voetbalveldje2.jpg")],
-		"Voetbalveldje 3": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Voetbalveldje3.jpg")],
-		"Mini ramp Waterwijk": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\mini_ramp.jpg")],
-		"Bankjes": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\bank.jpg")],
-		"Derde waterbrug": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Derde_brug.jpg"), Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Schermafbeelding 2026-02-01 144515.png")],
-		"Potentieel skatepark": [Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\Before_skatepark.jpg"), Path(r"C:\Users\Jermaine P\source\repos\Leeghwaterplas_Interactive_Map\Images_Leegh\skatepark_mini.jpg")],
-	}
-
-	# Load images into a map of base64 strings
-	image_map = load_images_to_map(marker_image_paths)
-
-	for (lat, lon), name, color, description in poi_markers:
-		if name in image_map:
-			img_srcs = image_map[name]
-			html = f"<b>{name}</b><br><small>{description}</small><br>" + "<br>".join(f'<img src="{src}" width="280" alt="{name} image">' for src in img_srcs)
-			iframe = folium.IFrame(html, width=300, height=300)
-			popup = folium.Popup(iframe, max_width=350)
-		else:
-			html = f"<b>{name}</b><br><small>{description}</small>"
-			iframe = folium.IFrame(html, width=300, height=200)
-			popup = folium.Popup(iframe, max_width=350)
-		folium.Marker(
-			location=(lat, lon),
-			popup=popup,
-			icon=folium.Icon(color=color, icon="info-sign"),
-		).add_to(m)
+	out_path = Path(output)
+
+	# Write popup thumbnails next to the output HTML and drop ones from older builds
+	image_map = load_images_to_map(MARKER_IMAGE_PATHS, out_path.parent)
+	_prune_thumbnails(out_path.parent, image_map)
+
+	# All POIs go into one GeoJSON layer so folium renders the marker section in a single pass
+	features = []
+	for (lat, lon), name, color, description in POI_MARKERS:
+		srcs = image_map.get(name, ())
+		popup_html = _popup_template().render(name=name, desc=description, srcs=srcs, height=300 if srcs else 200)
+		features.append({
+			"type": "Feature",
+			"geometry": {"type": "Point", "coordinates": [lon, lat]},
+			"properties": {
+				"name": name,
+				"color": color,
+				"popup_html": popup_html,
+			},
+		})
+	# Clustered so Leaflet only draws the markers/clusters visible at the current zoom
+	poi_layer = MarkerCluster(name="Points of interest", disableClusteringAtZoom=16)
+	folium.GeoJson(
+		{"type": "FeatureCollection", "features": features},
+		marker=folium.Marker(icon=folium.Icon(icon="info-sign")),
+		style_function=lambda feature: {"markerColor": feature["properties"]["color"]},
+		# Bind popups per marker: the cluster takes over the GeoJSON's markers, so a
+		# popup bound on the GeoJSON group itself would never open
+		on_each_feature=folium.JsCode(
+			"function(feature, layer) { layer.bindPopup(feature.properties.popup_html, {maxWidth: 350}); }"
+		),
+		control=False,
+	).add_to(poi_layer)
+	poi_layer.add_to(m)
 
 	# Useful plugins for walking-path exploration
 	MeasureControl(position="topleft", primary_length_unit="meters").add_to(m)
@@ -157,7 +299,6 @@ def build_map(output: str | Path = "leeghwaterplas_map.html") -> Path:
 
 	folium.LayerControl(collapsed=False).add_to(m)
 
-	out_path = Path(output)
 	m.save(out_path)
 	return out_path
 